@@ -28,17 +28,32 @@ DATE_TIME_CHARACTERISTIC_UUID = '00002a08-0000-1000-8000-00805f9b34fb'
 CHARACTERISTIC_USER_DESCRIPTION_DESCRIPTOR_UUID = '00002901-0000-1000-8000-00805f9b34fb'
 CLIENT_CHARACTERISTIC_CONFIGURATION_DESCRIPTOR_UUID = '00002902-0000-1000-8000-00805f9b34fb'
 
+# Contexts in which Bluetooth simulation was enabled via the helpers below. Lets
+# teardown skip `bluetooth.disableSimulation` for tests that never enabled it.
+_simulated_contexts: set[str] = set()
 
-async def setup_device(websocket, context_id: str) -> str:
-    """Simulates a powered-on Bluetooth adapter and a preconnected peripheral."""
-    await execute_command(
-        websocket, {
-            'method': 'bluetooth.simulateAdapter',
-            'params': {
-                'context': context_id,
-                'state': 'powered-on',
-            }
-        })
+
+def simulate_adapter_command(context_id: str, state: str) -> dict:
+    """Returns a `bluetooth.simulateAdapter` command, e.g. to batch it with
+    other commands via `execute_commands`."""
+    return {
+        'method': 'bluetooth.simulateAdapter',
+        'params': {
+            'context': context_id,
+            'state': state,
+        }
+    }
+
+
+async def simulate_adapter(websocket, context_id: str, state: str) -> None:
+    """Simulates a Bluetooth adapter in the given state."""
+    await execute_command(websocket,
+                          simulate_adapter_command(context_id, state))
+    _simulated_contexts.add(context_id)
+
+
+async def simulate_preconnected_peripheral(websocket, context_id: str) -> None:
+    """Simulates the fake preconnected peripheral."""
     await execute_command(
         websocket, {
             'method': 'bluetooth.simulatePreconnectedPeripheral',
@@ -54,6 +69,15 @@ async def setup_device(websocket, context_id: str) -> str:
                     ['12345678-1234-5678-9abc-def123456789', ],
             }
         })
+
+
+async def setup_device(websocket, context_id: str) -> str:
+    """Simulates a powered-on Bluetooth adapter and a preconnected peripheral."""
+    # These commands cannot be batched with `execute_commands`: the mapper
+    # processes commands concurrently, and `simulateAdapter` resets the
+    # emulation, which would drop a peripheral simulated in the meantime.
+    await simulate_adapter(websocket, context_id, 'powered-on')
+    await simulate_preconnected_peripheral(websocket, context_id)
     return FAKE_DEVICE_ADDRESS
 
 
@@ -87,6 +111,22 @@ async def request_device(websocket,
         })
 
 
+async def handle_request_device_prompt(websocket, context_id: str, event: dict,
+                                       accept: bool) -> None:
+    """Accepts or cancels the prompt from the given
+    `bluetooth.requestDevicePromptUpdated` event, selecting its first device."""
+    await execute_command(
+        websocket, {
+            'method': 'bluetooth.handleRequestDevicePrompt',
+            'params': {
+                'context': context_id,
+                'accept': accept,
+                'prompt': event['params']['prompt'],
+                'device': event['params']['devices'][0]['id']
+            }
+        })
+
+
 async def setup_granted_device(websocket,
                                context_id: str,
                                html,
@@ -103,16 +143,7 @@ async def setup_granted_device(websocket,
     await request_device(websocket, context_id, optional_services)
     event = await wait_for_event(websocket,
                                  'bluetooth.requestDevicePromptUpdated')
-    await execute_command(
-        websocket, {
-            'method': 'bluetooth.handleRequestDevicePrompt',
-            'params': {
-                'context': context_id,
-                'accept': True,
-                'prompt': event['params']['prompt'],
-                'device': event['params']['devices'][0]['id']
-            }
-        })
+    await handle_request_device_prompt(websocket, context_id, event, True)
     return device_address
 
 
@@ -217,3 +248,10 @@ async def disable_simulation(websocket, context_id: str) -> None:
                 'context': context_id,
             }
         })
+    _simulated_contexts.discard(context_id)
+
+
+async def disable_simulation_if_enabled(websocket, context_id: str) -> None:
+    """Disables Bluetooth simulation if a helper enabled it for the context."""
+    if context_id in _simulated_contexts:
+        await disable_simulation(websocket, context_id)
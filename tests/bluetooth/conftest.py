@@ -0,0 +1,36 @@
+#  Copyright 2025 Google LLC.
+#  Copyright (c) Microsoft Corporation.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Shared fixtures for Bluetooth BiDi tests."""
+
+import pytest_asyncio
+from test_helpers import execute_commands, goto_url_command, subscribe_command
+
+from . import (_simulated_contexts, simulate_adapter_command,
+               simulate_preconnected_peripheral)
+
+
+@pytest_asyncio.fixture
+async def bluetooth_page(websocket, context_id, url_example):
+    """Navigates to a page with a simulated Bluetooth device, subscribed to
+    Bluetooth events."""
+    # Subscribing, navigating and simulating the adapter do not depend on each
+    # other, so they are sent in one burst. The peripheral needs the adapter.
+    await execute_commands(websocket, [
+        subscribe_command(['bluetooth']),
+        goto_url_command(context_id, url_example),
+        simulate_adapter_command(context_id, 'powered-on')
+    ])
+    _simulated_contexts.add(context_id)
+    await simulate_preconnected_peripheral(websocket, context_id)
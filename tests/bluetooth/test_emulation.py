@@ -13,63 +13,54 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import re
+
 import pytest
 import pytest_asyncio
-from test_helpers import (AnyExtending, execute_command, goto_url, subscribe,
-                          wait_for_event)
+from test_helpers import AnyExtending, execute_command, wait_for_event
+
+from . import (FAKE_DEVICE_ADDRESS, FAKE_DEVICE_NAME,
+               disable_simulation_if_enabled, handle_request_device_prompt,
+               request_device, setup_device, simulate_adapter,
+               simulate_preconnected_peripheral)
+
+pytestmark = pytest.mark.parametrize('capabilities', [{
+    'goog:chromeOptions': {
+        'args': ['--enable-features=WebBluetooth']
+    }
+}],
+                                     indirect=True)
 
-from . import (FAKE_DEVICE_ADDRESS, FAKE_DEVICE_NAME, disable_simulation,
-               request_device, setup_device)
+_NOT_ENABLED_ERROR_RE = re.compile(
+    re.escape(
+        str({
+            'error': 'unknown error',
+            'message': 'BluetoothEmulation not enabled'
+        })))
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def teardown(websocket, context_id):
     yield
-    await disable_simulation(websocket, context_id)
+    await disable_simulation_if_enabled(websocket, context_id)
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("state_1", ["absent", "powered-off", "powered-on"])
-@pytest.mark.parametrize("state_2", ["absent", "powered-off", "powered-on"])
-@pytest.mark.parametrize('capabilities', [{
-    'goog:chromeOptions': {
-        'args': ['--enable-features=WebBluetooth']
-    }
-}],
-                         indirect=True)
+@pytest.mark.parametrize("state_1,state_2", [
+    ("absent", "powered-on"),
+    ("powered-off", "powered-on"),
+    ("powered-on", "powered-on"),
+    ("powered-on", "powered-off"),
+])
 async def test_simulate_create_adapter_twice(websocket, context_id, state_1,
                                              state_2):
-    await execute_command(
-        websocket, {
-            'method': 'bluetooth.simulateAdapter',
-            'params': {
-                'context': context_id,
-                'state': state_1,
-            }
-        })
-
-    await execute_command(
-        websocket, {
-            'method': 'bluetooth.simulateAdapter',
-            'params': {
-                'context': context_id,
-                'state': state_2,
-            }
-        })
+    await simulate_adapter(websocket, context_id, state_1)
+    await simulate_adapter(websocket, context_id, state_2)
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize('capabilities', [{
-    'goog:chromeOptions': {
-        'args': ['--enable-features=WebBluetooth']
-    }
-}],
-                         indirect=True)
 async def test_bluetooth_requestDevicePromptUpdated(websocket, context_id,
-                                                    html):
-    await subscribe(websocket, ['bluetooth'])
-    await goto_url(websocket, context_id, html())
-    await setup_device(websocket, context_id)
+                                                    bluetooth_page):
     await request_device(websocket, context_id)
     response = await wait_for_event(websocket,
                                     'bluetooth.requestDevicePromptUpdated')
@@ -86,32 +77,13 @@ async def test_bluetooth_requestDevicePromptUpdated(websocket, context_id,
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize('capabilities', [{
-    'goog:chromeOptions': {
-        'args': ['--enable-features=WebBluetooth']
-    }
-}],
-                         indirect=True)
 @pytest.mark.parametrize('accept', [True, False])
-async def test_bluetooth_handleRequestDevicePrompt(websocket, context_id, html,
-                                                   accept):
-    await subscribe(websocket, ['bluetooth'])
-    await goto_url(websocket, context_id, html())
-    await setup_device(websocket, context_id)
+async def test_bluetooth_handleRequestDevicePrompt(websocket, context_id,
+                                                   bluetooth_page, accept):
     await request_device(websocket, context_id)
     event = await wait_for_event(websocket,
                                  'bluetooth.requestDevicePromptUpdated')
-
-    await execute_command(
-        websocket, {
-            'method': 'bluetooth.handleRequestDevicePrompt',
-            'params': {
-                'context': context_id,
-                'accept': accept,
-                'prompt': event['params']['prompt'],
-                'device': event['params']['devices'][0]['id']
-            }
-        })
+    await handle_request_device_prompt(websocket, context_id, event, accept)
 
 
 @pytest.mark.asyncio
@@ -143,34 +115,19 @@ async def test_bluetooth_disable_simulation(websocket, context_id):
             }
         })
     # Creating a fake BT device while simulation disabled would fail.
-    with pytest.raises(Exception,
-                       match=str({
-                           'error': 'unknown error',
-                           'message': 'BluetoothEmulation not enabled'
-                       })):
-        await execute_command(
-            websocket, {
-                'method': 'bluetooth.simulatePreconnectedPeripheral',
-                'params': {
-                    'context': context_id,
-                    'address': FAKE_DEVICE_ADDRESS,
-                    'name': FAKE_DEVICE_NAME,
-                    'manufacturerData': [{
-                        'key': 17,
-                        'data': 'AP8BAX8=',
-                    }],
-                    'knownServiceUuids':
-                        ['12345678-1234-5678-9abc-def123456789', ],
-                }
-            })
+    with pytest.raises(Exception, match=_NOT_ENABLED_ERROR_RE):
+        await simulate_preconnected_peripheral(websocket, context_id)
 
 
 @pytest.mark.asyncio
+@pytest.mark.xfail(
+    reason="Bluetooth simulation does not support multiple contexts yet",
+    run=False)
 async def test_bluetooth_disable_simulation_in_another_context(
         websocket, context_id, another_context_id):
-    pytest.xfail(
-        "Bluetooth simulation doesn not support multiple contexts yet")
-
+    # Not run concurrently: both contexts share the browser-wide Bluetooth
+    # emulation that `simulateAdapter` resets, and the helpers read responses
+    # from the websocket one command at a time.
     await setup_device(websocket, context_id)
     await setup_device(websocket, another_context_id)
     await execute_command(
@@ -182,21 +139,7 @@ async def test_bluetooth_disable_simulation_in_another_context(
         })
     # Simulation commands should still work after simulation is disabled in another
     # context.
-    await execute_command(
-        websocket, {
-            'method': 'bluetooth.simulatePreconnectedPeripheral',
-            'params': {
-                'context': context_id,
-                'address': FAKE_DEVICE_ADDRESS,
-                'name': FAKE_DEVICE_NAME,
-                'manufacturerData': [{
-                    'key': 17,
-                    'data': 'AP8BAX8=',
-                }],
-                'knownServiceUuids':
-                    ['12345678-1234-5678-9abc-def123456789', ],
-            }
-        })
+    await simulate_preconnected_peripheral(websocket, context_id)
 
 
 @pytest.mark.asyncio
@@ -15,11 +15,10 @@
 
 import pytest
 import pytest_asyncio
-from test_helpers import (AnyExtending, execute_command, goto_url, subscribe,
-                          wait_for_event)
+from test_helpers import AnyExtending, wait_for_event
 
-from . import (FAKE_DEVICE_ADDRESS, disable_simulation, request_device,
-               setup_device)
+from . import (FAKE_DEVICE_ADDRESS, disable_simulation,
+               handle_request_device_prompt, request_device)
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -36,10 +35,7 @@ async def teardown(websocket, context_id):
 }],
                          indirect=True)
 async def test_bluetooth_requestDevicePromptUpdated(websocket, context_id,
-                                                    html):
-    await subscribe(websocket, ['bluetooth.requestDevicePromptUpdated'])
-    await goto_url(websocket, context_id, html())
-    await setup_device(websocket, context_id)
+                                                    bluetooth_page):
     await request_device(websocket, context_id)
     response = await wait_for_event(websocket,
                                     'bluetooth.requestDevicePromptUpdated')
@@ -63,22 +59,9 @@ async def test_bluetooth_requestDevicePromptUpdated(websocket, context_id,
 }],
                          indirect=True)
 @pytest.mark.parametrize('accept', [True, False])
-async def test_bluetooth_handleRequestDevicePrompt(websocket, context_id, html,
-                                                   accept):
-    await subscribe(websocket, ['bluetooth'])
-    await goto_url(websocket, context_id, html())
-    await setup_device(websocket, context_id)
+async def test_bluetooth_handleRequestDevicePrompt(websocket, context_id,
+                                                   bluetooth_page, accept):
     await request_device(websocket, context_id)
     event = await wait_for_event(websocket,
                                  'bluetooth.requestDevicePromptUpdated')
-
-    await execute_command(
-        websocket, {
-            'method': 'bluetooth.handleRequestDevicePrompt',
-            'params': {
-                'context': context_id,
-                'accept': accept,
-                'prompt': event['params']['prompt'],
-                'device': event['params']['devices'][0]['id']
-            }
-        })
+    await handle_request_device_prompt(websocket, context_id, event, accept)
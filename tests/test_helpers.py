@@ -24,6 +24,7 @@ from collections.abc import Callable
 from typing import Literal
 from urllib.parse import urlparse
 
+import orjson
 from anys import (ANY_NUMBER, ANY_STR, AnyFullmatch, AnyGT, AnyLT, AnyMatch,
                   AnyWithEntries)
 from PIL import Image, ImageChops
@@ -47,6 +48,14 @@ async def subscribe(websocket,
                     events: list[str] | str,
                     context_ids: list[str] | str | None = None,
                     goog_channel: str | None = None):
+    return await execute_command(
+        websocket, subscribe_command(events, context_ids, goog_channel))
+
+
+def subscribe_command(events: list[str] | str,
+                      context_ids: list[str] | str | None = None,
+                      goog_channel: str | None = None) -> dict:
+    """Return a `session.subscribe` command for the given events."""
     if type(events) is str:
         events = [events]
 
@@ -65,19 +74,21 @@ async def subscribe(websocket,
     if goog_channel is not None:
         command["goog:channel"] = goog_channel
 
-    return await execute_command(websocket, command)
+    return command
 
 
 async def send_JSON_command(websocket, command: dict) -> int:
     if "id" not in command:
         command["id"] = get_next_command_id()
-    await websocket.send(json.dumps(command))
+    # BiDi commands must be sent as text frames, so the encoded bytes are
+    # decoded back to `str`.
+    await websocket.send(orjson.dumps(command).decode())
     return command["id"]
 
 
 async def read_JSON_message(websocket) -> dict:
     logging.info("calling websocket recv", exc_info=True)
-    result = json.loads(await websocket.recv())
+    result = orjson.loads(await websocket.recv())
     logging.info("calling websocket recv: done", exc_info=True)
     return result
 
@@ -94,16 +105,53 @@ async def execute_command(websocket, command: dict, timeout: int = 5) -> dict:
     return await wait_for_command(websocket, command["id"], timeout)
 
 
+async def execute_commands(websocket,
+                           commands: list[dict],
+                           timeout: int = 5) -> list[dict]:
+    """
+    Send the given commands back-to-back without waiting for each response,
+    and return their results in the same order as the commands. Responses are
+    matched by command id, so the server is free to answer in any order.
+    """
+    for command in commands:
+        await send_JSON_command(websocket, command)
+
+    logger.info(
+        f"Executing commands with methods '{[c['method'] for c in commands]}'..."
+    )
+    return await wait_for_commands(websocket,
+                                   [command["id"] for command in commands],
+                                   timeout)
+
+
 async def wait_for_command(websocket,
                            command_id: int,
                            timeout: int = 5) -> dict:
+    return (await wait_for_commands(websocket, [command_id], timeout))[0]
+
+
+async def wait_for_commands(websocket,
+                            command_ids: list[int],
+                            timeout: int = 5) -> list[dict]:
+    responses: dict[int, dict] = {}
+
     def _filter(resp):
-        return "id" in resp and resp["id"] == command_id
+        if "id" in resp and resp["id"] in command_ids:
+            responses[resp["id"]] = resp
+        return len(responses) == len(command_ids)
+
+    await wait_for_message(websocket, _filter, timeout)
 
-    resp = await wait_for_message(websocket, _filter, timeout)
-    if "result" in resp:
-        return resp["result"]
-    raise Exception({"error": resp["error"], "message": resp["message"]})
+    results = []
+    for command_id in command_ids:
+        resp = responses[command_id]
+        if "result" not in resp:
+            raise Exception({
+                "error": resp["error"],
+                "message": resp["message"]
+            })
+        results.append(resp["result"])
+    return results
 
 
 async def wait_for_message(websocket,
@@ -144,15 +192,23 @@ async def goto_url(
     logger.info(
         f"Navigating to url '{url}' with wait '{wait}' in context '{context_id}'..."
     )
-    return await execute_command(
-        websocket, {
-            "method": "browsingContext.navigate",
-            "params": {
-                "url": url,
-                "context": context_id,
-                "wait": wait
-            }
-        })
+    return await execute_command(websocket,
+                                 goto_url_command(context_id, url, wait))
+
+
+def goto_url_command(
+        context_id: str,
+        url: str,
+        wait: Literal["none", "interactive", "complete"] = "complete") -> dict:
+    """Return a `browsingContext.navigate` command for the given URL."""
+    return {
+        "method": "browsingContext.navigate",
+        "params": {
+            "url": url,
+            "context": context_id,
+            "wait": wait
+        }
+    }
 
 
 async def set_html_content(websocket, context_id: str, html_content: str):
@@ -190,11 +246,10 @@ async def wait_for_event(websocket, event_method: str) -> dict:
 async def wait_for_events(websocket, event_methods: list[str]) -> dict:
     """Wait and return any of the given event prefixes from BiDi server."""
     logger.info(f"Waiting for any of the events '{event_methods}'...")
+    prefixes = tuple(event_methods)
     return await wait_for_filtered_event(
-        websocket, lambda event_response: any([
-            event_response["method"].startswith(event_method)
-            for event_method in event_methods
-        ]))
+        websocket,
+        lambda event_response: event_response["method"].startswith(prefixes))
 
 
 async def wait_for_filtered_event(
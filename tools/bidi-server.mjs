@@ -74,6 +74,12 @@ export function parseCommandLineArgs() {
       type: 'number',
       default: Number(process.env.REPEAT_TIMES || 1),
     })
+    .option('workers', {
+      describe:
+        'If set, will run tests in parallel in this many pytest-xdist workers ("auto" for one per CPU)',
+      type: 'string',
+      default: process.env.PYTEST_WORKERS,
+    })
     .option('total-chunks', {
       describe: 'If provided, will split tests into this many shards.',
       type: 'number',
@@ -42,6 +42,7 @@ const PYTEST_TOTAL_CHUNKS = argv['total-chunks'];
 const PYTEST_THIS_CHUNK = argv['this-chunk'];
 const UPDATE_SNAPSHOT = argv['update-snapshot'] === 'true';
 const REPEAT_TIMES = argv['repeat-times'];
+const PYTEST_WORKERS = argv['workers'];
 
 /**
  *
@@ -161,6 +162,9 @@ e2eArgs.push(
 if (REPEAT_TIMES !== 1) {
   e2eArgs.push(`--count=${REPEAT_TIMES}`);
 }
+if (PYTEST_WORKERS) {
+  e2eArgs.push('-n', PYTEST_WORKERS);
+}
 if (PYTEST_TOTAL_CHUNKS !== 1) {
   e2eArgs.push(
     '--num-shards',